@@ -6,10 +6,22 @@ HTML2Image - HTML 转高清图片工具
 
 from __future__ import annotations
 
-from html2image.render import RenderResult, batch_render, render_html_to_image
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from html2image.render import RenderResult, batch_render, render_html_to_image
 
 __all__ = [
     "RenderResult",
     "batch_render",
     "render_html_to_image",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """延迟导入渲染模块，`import html2image` 本身不再触发重依赖加载"""
+    if name in __all__:
+        from html2image import render
+
+        return getattr(render, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib.metadata import version
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
@@ -9,19 +10,9 @@ from typing import TYPE_CHECKING, Annotated
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
 from rich.table import Table
 from rich.text import Text
 
-from html2image.render import batch_render, render_html_to_image
-
 if TYPE_CHECKING:
     pass
 
@@ -39,13 +30,13 @@ LOGO = r"""
 """
 
 
-def gradient_text(text: str, colors: list[str] | None = None) -> Text:
-    """创建渐变色文本"""
+@lru_cache(maxsize=8)
+def _gradient_text_cached(text: str, colors: tuple[str, ...]) -> Text:
+    """按 (text, colors) 缓存的渐变渲染实现，LOGO 等常量文本只计算一次"""
     from rich.color import Color
 
-    if colors is None:
-        # 蓝紫渐变：专业科技感
-        colors = ["#60a5fa", "#818cf8", "#a78bfa", "#c084fc"]
+    # 每种颜色只解析一次，字符循环里只做线性插值
+    triplets = [Color.parse(color).triplet for color in colors]
 
     result = Text()
     lines = text.split("\n")
@@ -60,12 +51,12 @@ def gradient_text(text: str, colors: list[str] | None = None) -> Text:
             idx2 = min(idx1 + 1, len(colors) - 1)
             blend = color_pos - idx1
 
-            c1 = Color.parse(colors[idx1])
-            c2 = Color.parse(colors[idx2])
-            if c1.triplet and c2.triplet:
-                r = int(c1.triplet.red * (1 - blend) + c2.triplet.red * blend)
-                g = int(c1.triplet.green * (1 - blend) + c2.triplet.green * blend)
-                b = int(c1.triplet.blue * (1 - blend) + c2.triplet.blue * blend)
+            c1 = triplets[idx1]
+            c2 = triplets[idx2]
+            if c1 and c2:
+                r = int(c1.red * (1 - blend) + c2.red * blend)
+                g = int(c1.green * (1 - blend) + c2.green * blend)
+                b = int(c1.blue * (1 - blend) + c2.blue * blend)
                 result.append(char, style=f"bold rgb({r},{g},{b})")
             else:
                 result.append(char, style=f"bold {colors[idx1]}")
@@ -75,6 +66,15 @@ def gradient_text(text: str, colors: list[str] | None = None) -> Text:
     return result
 
 
+def gradient_text(text: str, colors: list[str] | None = None) -> Text:
+    """创建渐变色文本"""
+    if colors is None:
+        # 蓝紫渐变：专业科技感
+        colors = ["#60a5fa", "#818cf8", "#a78bfa", "#c084fc"]
+
+    return _gradient_text_cached(text, tuple(colors))
+
+
 def print_success(message: str) -> None:
     """打印成功信息"""
     console.print(f"[bold green]✓[/] {message}")
@@ -205,10 +205,19 @@ def render_command(
         int,
         typer.Option(
             "--wait",
-            help="额外等待渲染时间（毫秒）",
+            help="等待字体/图片就绪的最长时间（毫秒）",
             rich_help_panel="渲染选项",
         ),
     ] = 500,
+    output_width: Annotated[
+        int | None,
+        typer.Option(
+            "--output-width",
+            help="输出图片目标宽度（渲染后等比缩小）",
+            rich_help_panel="输出选项",
+            min=1,
+        ),
+    ] = None,
 ) -> None:
     """
     渲染单个 [green]HTML[/] 文件为高清图片
@@ -219,6 +228,20 @@ def render_command(
       html2image render page.html -o output.png --scale 3
       html2image render page.html --format jpeg --quality 95
     """
+    # 渲染相关的重依赖（playwright 等）推迟到真正执行命令时再导入，
+    # --help/--version 等路径不再支付这部分启动成本
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from html2image.daemon import request_render
+    from html2image.render import render_html_to_image
+
     # 验证格式
     if fmt not in ("png", "jpeg"):
         print_error(f"不支持的格式: {fmt}，请使用 png 或 jpeg")
@@ -248,8 +271,9 @@ def render_command(
         ) as progress:
             task = progress.add_task(f"[cyan]渲染 {input_path.name}...", total=100)
 
-            progress.update(task, advance=20, description="[cyan]启动浏览器...")
-            result = render_html_to_image(
+            # 优先交给常驻守护进程（html2image daemon），省掉浏览器冷启动
+            progress.update(task, advance=20, description="[cyan]连接守护进程...")
+            result = request_render(
                 input_path=input_path,
                 output_path=output_path,
                 width=width,
@@ -257,7 +281,20 @@ def render_command(
                 fmt=fmt,
                 quality=quality,
                 wait_ms=wait,
+                output_width=output_width,
             )
+            if result is None:
+                progress.update(task, description="[cyan]启动浏览器...")
+                result = render_html_to_image(
+                    input_path=input_path,
+                    output_path=output_path,
+                    width=width,
+                    scale=scale,
+                    fmt=fmt,
+                    quality=quality,
+                    wait_ms=wait,
+                    output_width=output_width,
+                )
             progress.update(task, advance=80, description="[green]渲染完成")
 
         console.print()
@@ -336,10 +373,29 @@ def batch_command(
         int,
         typer.Option(
             "--wait",
-            help="额外等待渲染时间（毫秒）",
+            help="等待字体/图片就绪的最长时间（毫秒）",
             rich_help_panel="渲染选项",
         ),
     ] = 500,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "-c",
+            "--concurrency",
+            help="并发渲染的页面数量",
+            rich_help_panel="渲染选项",
+            min=1,
+        ),
+    ] = 4,
+    output_width: Annotated[
+        int | None,
+        typer.Option(
+            "--output-width",
+            help="输出图片目标宽度（渲染后等比缩小）",
+            rich_help_panel="输出选项",
+            min=1,
+        ),
+    ] = None,
 ) -> None:
     """
     批量渲染目录下所有 [green]HTML[/] 文件
@@ -350,6 +406,8 @@ def batch_command(
       html2image batch ./pages -o ./images --scale 3
       html2image batch ./docs --format jpeg --quality 90
     """
+    from html2image.render import batch_render
+
     # 验证格式
     if fmt not in ("png", "jpeg"):
         print_error(f"不支持的格式: {fmt}，请使用 png 或 jpeg")
@@ -369,6 +427,8 @@ def batch_command(
             fmt=fmt,
             quality=quality,
             wait_ms=wait,
+            output_width=output_width,
+            concurrency=concurrency,
             console=console,
         )
 
@@ -403,6 +463,27 @@ def batch_command(
         raise typer.Exit(1) from None
 
 
+@app.command("daemon")
+def daemon_command() -> None:
+    """
+    启动常驻渲染守护进程，后续 [green]render[/] 命令免浏览器冷启动
+
+    \b
+    示例:
+      html2image daemon          # 前台运行，Ctrl+C 停止
+    """
+    from html2image.daemon import serve
+
+    console.print()
+    console.print(gradient_text(LOGO))
+
+    try:
+        serve(console=console)
+    except Exception as e:
+        print_error(f"守护进程异常退出: {e}")
+        raise typer.Exit(1) from None
+
+
 def cli_main() -> None:
     """CLI 入口点"""
     app()
@@ -0,0 +1,172 @@
+"""渲染守护进程 - 常驻 Chromium 进程，消除每次 CLI 调用的冷启动开销"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from html2image.render import _BROWSER_ARGS, _INIT_SCRIPT_JS, RenderResult, _render_on_page
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext
+    from rich.console import Console
+
+
+def socket_path() -> Path:
+    """守护进程监听的 Unix 套接字路径"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / "html2image.sock"
+
+
+def request_render(
+    input_path: Path,
+    output_path: Path,
+    width: int = 1200,
+    scale: float = 2.0,
+    fmt: str = "png",
+    quality: int = 90,
+    wait_ms: int = 500,
+    output_width: int | None = None,
+) -> RenderResult | None:
+    """
+    尝试把渲染任务交给守护进程处理
+
+    守护进程未运行（或套接字不可用）时返回 None，调用方应回退到
+    进程内渲染；守护进程渲染失败时抛出 RuntimeError。
+    """
+    path = socket_path()
+    if not path.exists():
+        return None
+
+    job = {
+        "input_path": str(input_path.resolve()),
+        "output_path": str(output_path.resolve()),
+        "width": width,
+        "scale": scale,
+        "fmt": fmt,
+        "quality": quality,
+        "wait_ms": wait_ms,
+        "output_width": output_width,
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+            sock.sendall(json.dumps(job).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            data = b""
+            while chunk := sock.recv(65536):
+                data += chunk
+    except OSError:
+        # 套接字残留但守护进程已退出等情况，回退到进程内渲染
+        return None
+
+    reply = json.loads(data)
+    if not reply.get("ok"):
+        raise RuntimeError(reply.get("error", "守护进程渲染失败"))
+
+    return RenderResult(
+        output_path=Path(reply["output_path"]),
+        width=reply["width"],
+        height=reply["height"],
+        size_mb=reply["size_mb"],
+    )
+
+
+def _handle_job(context: BrowserContext, job: dict[str, Any]) -> dict[str, Any]:
+    """在常驻上下文上执行单个渲染任务，返回 JSON 应答"""
+    try:
+        page = context.new_page()
+        try:
+            # 持久化上下文只有一份，每个任务的 width/scale 通过 CDP 覆盖
+            cdp = context.new_cdp_session(page)
+            cdp.send(
+                "Emulation.setDeviceMetricsOverride",
+                {
+                    "width": job["width"],
+                    "height": 800,
+                    "deviceScaleFactor": job["scale"],
+                    "mobile": False,
+                },
+            )
+            result = _render_on_page(
+                page,
+                input_path=Path(job["input_path"]),
+                output_path=Path(job["output_path"]),
+                width=job["width"],
+                scale=job["scale"],
+                fmt=job["fmt"],
+                quality=job["quality"],
+                wait_ms=job["wait_ms"],
+                output_width=job.get("output_width"),
+            )
+        finally:
+            page.close()
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+    return {
+        "ok": True,
+        "output_path": str(result.output_path),
+        "width": result.width,
+        "height": result.height,
+        "size_mb": result.size_mb,
+    }
+
+
+def serve(console: Console | None = None) -> None:
+    """
+    启动守护进程：常驻一个热浏览器，循环处理套接字上送来的渲染任务
+
+    浏览器通过 launch_persistent_context 保持用户数据目录（字体枚举、
+    缓存等）常驻，后续的 `html2image render` 调用不再支付冷启动成本。
+    """
+    from playwright.sync_api import sync_playwright
+
+    path = socket_path()
+    path.unlink(missing_ok=True)
+
+    user_data_dir = Path(tempfile.gettempdir()) / "html2image-profile"
+    playwright = sync_playwright().start()
+    context = playwright.chromium.launch_persistent_context(
+        user_data_dir=str(user_data_dir),
+        args=_BROWSER_ARGS,
+        viewport={"width": 1200, "height": 800},
+    )
+    context.add_init_script(_INIT_SCRIPT_JS)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(path))
+        server.listen()
+        if console:
+            console.print(f"[bold blue]→[/] 守护进程已启动，监听 [dim]{path}[/]")
+
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                # 单个连接出错（请求不是合法 JSON、客户端提前断开等）
+                # 只记录并继续循环，不能拖垮常驻的守护进程
+                try:
+                    data = b""
+                    while b"\n" not in data and (chunk := conn.recv(65536)):
+                        data += chunk
+                    if not data:
+                        continue
+                    reply = _handle_job(context, json.loads(data))
+                    conn.sendall(json.dumps(reply).encode("utf-8"))
+                except (OSError, ValueError) as e:
+                    if console:
+                        console.print(f"[red]✗[/] 连接处理失败: {e}")
+    except KeyboardInterrupt:
+        if console:
+            console.print("[bold blue]→[/] 守护进程已停止")
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+        context.close()
+        playwright.stop()
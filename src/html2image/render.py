@@ -2,17 +2,197 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import mimetypes
+import os
+import queue
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
-
-from playwright.sync_api import sync_playwright
+from urllib.parse import unquote, urlsplit
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from playwright.async_api import Page as AsyncPage
+    from playwright.async_api import Request as AsyncRequest
+    from playwright.async_api import Route as AsyncRoute
+    from playwright.sync_api import Page
     from rich.console import Console
+    from rich.progress import Progress, TaskID
+
+    # 每完成一个文件回调一次：(输入文件, 结果或 None, 异常或 None)
+    OnDone = Callable[[Path, "RenderResult | None", "Exception | None"], None]
+
+# 浏览器启动参数：优化字体渲染，并关闭与无头截图无关的子系统
+# （扩展/音频/GPU/后台联网等），降低启动耗时和每实例内存占用
+_BROWSER_ARGS = [
+    "--font-render-hinting=none",
+    "--disable-lcd-text",
+    "--disable-font-subpixel-positioning",
+    "--headless=new",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-audio-output",
+    "--mute-audio",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+# 就绪辅助函数：单次调用完成全部就绪步骤（字体、图片、Lucide 图标）
+# 并返回页面实际高度；waitMs 通过 Promise.race 充当就绪等待的上限
+_READY_HELPER_JS = """async (waitMs) => {
+    const ready = (async () => {
+        await document.fonts.ready;
+        await Promise.all(Array.from(document.images).map(img => {
+            if (img.complete) return null;
+            return new Promise((resolve) => {
+                img.addEventListener('load', resolve);
+                img.addEventListener('error', resolve);
+            });
+        }));
+    })();
+    await Promise.race([ready, new Promise(r => setTimeout(r, waitMs))]);
+    if (typeof lucide !== 'undefined' && lucide.createIcons) {
+        lucide.createIcons();
+    }
+    return Math.max(
+        document.body.scrollHeight,
+        document.body.offsetHeight,
+        document.documentElement.clientHeight,
+        document.documentElement.scrollHeight,
+        document.documentElement.offsetHeight
+    );
+}"""
+
+# 辅助函数经 add_init_script 预注册到 window，每个页面只解析编译一次；
+# 页面级 evaluate 只发送下面这条极短的调用表达式
+_INIT_SCRIPT_JS = f"window.__h2i_ready = {_READY_HELPER_JS};"
+_PAGE_READY_JS = "(waitMs) => window.__h2i_ready(waitMs)"
+
+
+# 批量渲染时从缓存直出的共享资源类型（HTML 文档本身始终交给 Chromium 读取）
+_SHARED_ASSET_SUFFIXES = (
+    ".css",
+    ".js",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".svg",
+    ".webp",
+    ".woff",
+    ".woff2",
+    ".ttf",
+    ".otf",
+)
+
+
+class _AssetCache:
+    """批量渲染期间共享资源的进程内 LRU 字节缓存，按解析后的文件路径键控"""
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._total = 0
+
+    def get_or_load(self, path: Path) -> bytes:
+        key = str(path)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        data = path.read_bytes()
+        self._entries[key] = data
+        self._total += len(data)
+        while self._total > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total -= len(evicted)
+        return data
+
+
+def _resize_to_width(buf: bytes, output_width: int) -> tuple[bytes, int, int]:
+    """把 PNG 截图字节等比缩小到目标宽度，返回 (字节, 实际宽, 实际高)
+
+    目标宽度会吸附到源宽度的最近约数，这样缩放可以走整数因子的
+    盒式平均（Image.reduce）而不是通用 Lanczos 卷积，快数倍，
+    且保证输出为整数像素尺寸；因此实际输出宽度可能与请求值有出入，
+    调用方应以返回的尺寸为准。
+    """
+    import io
+
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(buf))
+    if img.width <= output_width:
+        return buf, img.width, img.height
+
+    divisors = [d for d in range(1, img.width + 1) if img.width % d == 0]
+    snapped = min(divisors, key=lambda d: abs(d - output_width))
+    factor = img.width // snapped
+    if factor == 1:
+        return buf, img.width, img.height
+
+    reduced = img.reduce(factor)
+    out = io.BytesIO()
+    reduced.save(out, format="PNG")
+    return out.getvalue(), reduced.width, reduced.height
+
 
+def _encode_jpeg(png_buf: bytes, quality: int) -> bytes:
+    """把 PNG 截图字节重编码为 JPEG（Pillow/libjpeg-turbo，x86 上有 SIMD 加速）"""
+    import io
 
-@dataclass
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(png_buf))
+    out = io.BytesIO()
+    img.convert("RGB").save(
+        out,
+        format="JPEG",
+        quality=quality,
+        optimize=True,
+        progressive=True,
+        subsampling=2,
+    )
+    return out.getvalue()
+
+
+def _write_output(output_path: Path, buf: bytes) -> None:
+    """用一次 writev 向量写把输出字节落盘，不可用时回退到 Path.write_bytes"""
+    if not hasattr(os, "writev"):
+        output_path.write_bytes(buf)
+        return
+
+    try:
+        fd = os.open(str(output_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # writev 可能发生短写（信号中断等），循环推进视图直到写完
+            view = memoryview(buf)
+            while view:
+                written = os.writev(fd, [view])
+                view = view[written:]
+        finally:
+            os.close(fd)
+    except OSError:
+        output_path.write_bytes(buf)
+
+
+def _optimize_png(buf: bytes) -> bytes:
+    """用 oxipng 在进程内优化 PNG 字节，未安装 oxipng 时原样返回"""
+    try:
+        import oxipng
+    except ImportError:
+        return buf
+    return bytes(oxipng.optimize_from_memory(buf, level=2))
+
+
+@dataclass(slots=True, frozen=True)
 class RenderResult:
     """渲染结果"""
 
@@ -22,6 +202,140 @@ class RenderResult:
     size_mb: float
 
 
+def _finish_render(
+    buf: bytes,
+    output_path: Path,
+    width: int,
+    scale: float,
+    fmt: str,
+    quality: int,
+    body_height: int,
+    output_width: int | None,
+) -> RenderResult:
+    """截图字节的后处理：缩放、编码、落盘并生成结果元数据（纯同步逻辑，
+    同步/异步两条渲染路径共用）"""
+    actual_width = int(width * scale)
+    actual_height = int(body_height * scale)
+
+    # 按需在写盘前等比缩小，避免为了小尺寸输出而降低 scale 重新渲染；
+    # 元数据取缩放的实际结果（目标宽度会被吸附到源宽度的约数）
+    if output_width:
+        buf, actual_width, actual_height = _resize_to_width(buf, output_width)
+
+    buf = _optimize_png(buf) if fmt == "png" else _encode_jpeg(buf, quality)
+    _write_output(output_path, buf)
+
+    # 输出大小直接取内存字节长度，省一次 stat 系统调用
+    size_mb = len(buf) / 1024 / 1024
+
+    return RenderResult(
+        output_path=output_path,
+        width=actual_width,
+        height=actual_height,
+        size_mb=size_mb,
+    )
+
+
+def _render_on_page(
+    page: Page,
+    input_path: Path,
+    output_path: Path,
+    width: int = 1200,
+    scale: float = 2.0,
+    fmt: str = "png",
+    quality: int = 90,
+    wait_ms: int = 500,
+    output_width: int | None = None,
+) -> RenderResult:
+    """在已打开的页面上执行渲染，假定浏览器上下文已按 width/scale 配置好"""
+    input_path = input_path.resolve()
+    output_path = output_path.resolve()
+
+    if not input_path.exists():
+        raise FileNotFoundError(f"文件不存在: {input_path}")
+
+    # 确保输出目录存在
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 导航到HTML文件（as_uri 正确转义空格和非 ASCII 字符）；
+    # 就绪条件由后面的显式等待保证，不再支付 networkidle 的 500ms 静默期
+    page.goto(input_path.as_uri(), wait_until="domcontentloaded", timeout=30000)
+
+    # 一次求值完成就绪等待（字体/图片/Lucide）并拿到页面实际高度
+    body_height = page.evaluate(_PAGE_READY_JS, wait_ms)
+
+    # 直接用 CDP Page.captureScreenshot 一次往返拿到整页 PNG 字节，
+    # 省掉 Playwright full_page 截图内部的 度量/调视口/还原 多次往返；
+    # PNG 经 oxipng 进程内优化，JPEG 经 Pillow(libjpeg-turbo) 重编码
+    cdp = page.context.new_cdp_session(page)
+    capture = cdp.send(
+        "Page.captureScreenshot",
+        {"format": "png", "captureBeyondViewport": True, "fromSurface": True},
+    )
+    buf = base64.b64decode(capture["data"])
+
+    return _finish_render(
+        buf,
+        output_path=output_path,
+        width=width,
+        scale=scale,
+        fmt=fmt,
+        quality=quality,
+        body_height=body_height,
+        output_width=output_width,
+    )
+
+
+async def _render_on_page_async(
+    page: AsyncPage,
+    input_path: Path,
+    output_path: Path,
+    width: int = 1200,
+    scale: float = 2.0,
+    fmt: str = "png",
+    quality: int = 90,
+    wait_ms: int = 500,
+    output_width: int | None = None,
+) -> RenderResult:
+    """_render_on_page 的异步版本，供批量流水线在共享上下文的多个页面上并发执行"""
+    input_path = input_path.resolve()
+    output_path = output_path.resolve()
+
+    if not input_path.exists():
+        raise FileNotFoundError(f"文件不存在: {input_path}")
+
+    # 确保输出目录存在
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 导航到HTML文件（as_uri 正确转义空格和非 ASCII 字符）；
+    # 就绪条件由后面的显式等待保证，不再支付 networkidle 的 500ms 静默期
+    await page.goto(input_path.as_uri(), wait_until="domcontentloaded", timeout=30000)
+
+    # 一次求值完成就绪等待（字体/图片/Lucide）并拿到页面实际高度
+    body_height = await page.evaluate(_PAGE_READY_JS, wait_ms)
+
+    # 直接用 CDP Page.captureScreenshot 一次往返拿到整页 PNG 字节，
+    # 省掉 Playwright full_page 截图内部的 度量/调视口/还原 多次往返；
+    # PNG 经 oxipng 进程内优化，JPEG 经 Pillow(libjpeg-turbo) 重编码
+    cdp = await page.context.new_cdp_session(page)
+    capture = await cdp.send(
+        "Page.captureScreenshot",
+        {"format": "png", "captureBeyondViewport": True, "fromSurface": True},
+    )
+    buf = base64.b64decode(capture["data"])
+
+    return _finish_render(
+        buf,
+        output_path=output_path,
+        width=width,
+        scale=scale,
+        fmt=fmt,
+        quality=quality,
+        body_height=body_height,
+        output_width=output_width,
+    )
+
+
 def render_html_to_image(
     input_path: Path,
     output_path: Path,
@@ -30,6 +344,7 @@ def render_html_to_image(
     fmt: str = "png",
     quality: int = 90,
     wait_ms: int = 500,
+    output_width: int | None = None,
 ) -> RenderResult:
     """
     将HTML文件渲染为高清图片
@@ -41,116 +356,247 @@ def render_html_to_image(
         scale: DPI缩放比例（2=2x高清，3=3x超清）
         fmt: 输出格式 png/jpeg
         quality: JPEG质量 0-100
-        wait_ms: 额外等待时间(毫秒)
+        wait_ms: 等待字体/图片就绪的最长时间(毫秒)
+        output_width: 输出图片目标宽度（渲染后等比缩小，默认不缩放）
 
     Returns:
         RenderResult: 渲染结果信息
     """
-    input_path = input_path.resolve()
-    output_path = output_path.resolve()
-
-    if not input_path.exists():
-        raise FileNotFoundError(f"文件不存在: {input_path}")
-
-    # 确保输出目录存在
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    from playwright.sync_api import sync_playwright
 
     with sync_playwright() as p:
         # 启动浏览器，优化字体渲染
-        browser = p.chromium.launch(
-            args=[
-                "--font-render-hinting=none",
-                "--disable-lcd-text",
-                "--disable-font-subpixel-positioning",
-            ]
-        )
+        browser = p.chromium.launch(args=_BROWSER_ARGS)
 
         # 创建上下文，设置高DPI
         context = browser.new_context(
             viewport={"width": width, "height": 800},
             device_scale_factor=scale,
         )
+        context.add_init_script(_INIT_SCRIPT_JS)
 
         page = context.new_page()
 
-        # 导航到HTML文件
-        page.goto(f"file://{input_path}", wait_until="networkidle", timeout=30000)
-
-        # 等待字体加载完成
-        page.evaluate("() => document.fonts.ready")
-
-        # 等待所有图片加载
-        page.evaluate(
-            """() => {
-            const images = Array.from(document.images);
-            return Promise.all(images.map(img => {
-                if (img.complete) return Promise.resolve();
-                return new Promise((resolve) => {
-                    img.addEventListener('load', resolve);
-                    img.addEventListener('error', resolve);
-                });
-            }));
-        }"""
-        )
+        try:
+            return _render_on_page(
+                page,
+                input_path=input_path,
+                output_path=output_path,
+                width=width,
+                scale=scale,
+                fmt=fmt,
+                quality=quality,
+                wait_ms=wait_ms,
+                output_width=output_width,
+            )
+        finally:
+            browser.close()
+
+
+async def _batch_render_async(
+    jobs: list[tuple[Path, Path]],
+    width: int,
+    scale: float,
+    fmt: str,
+    quality: int,
+    wait_ms: int,
+    output_width: int | None,
+    concurrency: int,
+    on_done: OnDone,
+) -> list[RenderResult]:
+    """在单个浏览器上用 N 个并发页面流水线处理批量任务"""
+    from playwright.async_api import async_playwright
 
-        # 等待Lucide图标渲染
-        page.evaluate(
-            """() => {
-            if (typeof lucide !== 'undefined' && lucide.createIcons) {
-                lucide.createIcons();
-            }
-        }"""
-        )
+    results: list[RenderResult] = []
+    # 固定容量队列把完成的结果送回进度更新协程
+    done_queue: asyncio.Queue[tuple[Path, RenderResult | None, Exception | None]] = asyncio.Queue(
+        maxsize=concurrency
+    )
+    semaphore = asyncio.Semaphore(concurrency)
 
-        # 额外等待确保渲染完成
-        page.wait_for_timeout(wait_ms)
-
-        # 获取页面实际高度
-        body_height = page.evaluate(
-            """() => {
-            return Math.max(
-                document.body.scrollHeight,
-                document.body.offsetHeight,
-                document.documentElement.clientHeight,
-                document.documentElement.scrollHeight,
-                document.documentElement.offsetHeight
-            );
-        }"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(args=_BROWSER_ARGS)
+        context = await browser.new_context(
+            viewport={"width": width, "height": 800},
+            device_scale_factor=scale,
         )
+        await context.add_init_script(_INIT_SCRIPT_JS)
 
-        # 设置视口高度为页面实际高度
-        page.set_viewport_size({"width": width, "height": body_height})
-
-        # 等待布局稳定
-        page.wait_for_timeout(200)
+        # 多个 HTML 共享的 CSS/JS/图片/字体从进程内缓存直出，
+        # 缓存覆盖本次批量的全部文件，每个共享资源只读一次磁盘
+        asset_cache = _AssetCache()
 
-        # 截图配置
-        screenshot_options: dict = {
-            "path": str(output_path),
-            "full_page": True,
-            "type": fmt,
-        }
+        async def serve_shared_assets(route: AsyncRoute, request: AsyncRequest) -> None:
+            url = request.url
+            if not url.startswith("file://"):
+                await route.continue_()
+                return
 
-        if fmt == "jpeg":
-            screenshot_options["quality"] = quality
+            asset_path = Path(unquote(urlsplit(url).path))
+            if asset_path.suffix.lower() not in _SHARED_ASSET_SUFFIXES:
+                await route.continue_()
+                return
 
-        page.screenshot(**screenshot_options)
+            try:
+                body = asset_cache.get_or_load(asset_path)
+            except OSError:
+                await route.continue_()
+                return
+
+            content_type = mimetypes.guess_type(url)[0] or "application/octet-stream"
+            await route.fulfill(body=body, content_type=content_type)
+
+        await context.route("**/*", serve_shared_assets)
+
+        async def render_one(html_file: Path, output_path: Path) -> None:
+            async with semaphore:
+                try:
+                    page = await context.new_page()
+                    try:
+                        result = await _render_on_page_async(
+                            page,
+                            input_path=html_file,
+                            output_path=output_path,
+                            width=width,
+                            scale=scale,
+                            fmt=fmt,
+                            quality=quality,
+                            wait_ms=wait_ms,
+                            output_width=output_width,
+                        )
+                    finally:
+                        await page.close()
+                except Exception as e:
+                    await done_queue.put((html_file, None, e))
+                else:
+                    await done_queue.put((html_file, result, None))
+
+        async def consume_results() -> None:
+            for _ in jobs:
+                html_file, result, error = await done_queue.get()
+                if result is not None:
+                    results.append(result)
+                on_done(html_file, result, error)
+
+        try:
+            await asyncio.gather(consume_results(), *(render_one(f, out) for f, out in jobs))
+        finally:
+            await browser.close()
 
-        browser.close()
+    return results
 
-    # 获取输出文件信息
-    size_mb = output_path.stat().st_size / 1024 / 1024
-    actual_width = int(width * scale)
-    actual_height = int(body_height * scale)
 
-    return RenderResult(
-        output_path=output_path,
-        width=actual_width,
-        height=actual_height,
-        size_mb=size_mb,
+# 超过该文件数后，单个 Chromium 的 GPU/合成线程成为瓶颈，改用多进程
+_MULTIPROCESS_THRESHOLD = 16
+
+
+def _split_chunks(items: list, n: int) -> list[list]:
+    """把列表按顺序尽量均匀地切成 n 份（不足 n 份时省略空块）"""
+    size, extra = divmod(len(items), n)
+    chunks = []
+    start = 0
+    for i in range(n):
+        end = start + size + (1 if i < extra else 0)
+        if start < end:
+            chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def _batch_worker(
+    jobs: list[tuple[Path, Path]],
+    width: int,
+    scale: float,
+    fmt: str,
+    quality: int,
+    wait_ms: int,
+    output_width: int | None,
+    concurrency: int,
+    progress_queue: queue.Queue[tuple[str, str | None]],
+) -> list[RenderResult]:
+    """子进程入口：独立浏览器跑异步流水线，进度经 progress_queue 上报主进程"""
+
+    def on_done(html_file: Path, _result: RenderResult | None, error: Exception | None) -> None:
+        progress_queue.put((html_file.name, str(error) if error is not None else None))
+
+    return asyncio.run(
+        _batch_render_async(
+            jobs,
+            width=width,
+            scale=scale,
+            fmt=fmt,
+            quality=quality,
+            wait_ms=wait_ms,
+            output_width=output_width,
+            concurrency=concurrency,
+            on_done=on_done,
+        )
     )
 
 
+def _batch_render_multiprocess(
+    jobs: list[tuple[Path, Path]],
+    width: int,
+    scale: float,
+    fmt: str,
+    quality: int,
+    wait_ms: int,
+    output_width: int | None,
+    concurrency: int,
+    progress: Progress,
+    task: TaskID,
+    console: Console | None,
+) -> list[RenderResult]:
+    """把任务块分给多个 worker 进程并在主进程汇总进度与结果"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(max((os.cpu_count() or 2) // 2, 1), 4, len(jobs))
+    chunks = _split_chunks(jobs, workers)
+
+    with multiprocessing.Manager() as manager:
+        progress_queue = manager.Queue()
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [
+                pool.submit(
+                    _batch_worker,
+                    chunk,
+                    width,
+                    scale,
+                    fmt,
+                    quality,
+                    wait_ms,
+                    output_width,
+                    concurrency,
+                    progress_queue,
+                )
+                for chunk in chunks
+            ]
+
+            # worker 进程（类似网络线程）生产进度事件，主进程消费并画进度条
+            done = 0
+            while done < len(jobs):
+                try:
+                    name, error = progress_queue.get(timeout=1)
+                except queue.Empty:
+                    if all(f.done() for f in futures):
+                        break
+                    continue
+                if error is not None:
+                    if console:
+                        console.print(f"[red]✗[/] 处理失败: {name} - {error}")
+                else:
+                    progress.update(task, description=f"[cyan]渲染 {name}...")
+                progress.advance(task)
+                done += 1
+
+            results: list[RenderResult] = []
+            for future in futures:
+                results.extend(future.result())
+
+    return results
+
+
 def batch_render(
     directory: Path,
     output_dir: Path | None = None,
@@ -159,6 +605,8 @@ def batch_render(
     fmt: str = "png",
     quality: int = 90,
     wait_ms: int = 500,
+    output_width: int | None = None,
+    concurrency: int = 4,
     console: Console | None = None,
 ) -> list[RenderResult]:
     """
@@ -171,7 +619,9 @@ def batch_render(
         scale: DPI缩放比例
         fmt: 输出格式
         quality: JPEG质量
-        wait_ms: 额外等待时间
+        wait_ms: 等待字体/图片就绪的最长时间(毫秒)
+        output_width: 输出图片目标宽度（渲染后等比缩小）
+        concurrency: 并发页面数量
         console: Rich Console 实例
 
     Returns:
@@ -195,13 +645,24 @@ def batch_render(
     # 确保输出目录存在
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    html_files = list(directory.glob("*.html")) + list(directory.glob("*.htm"))
+    # 单次 scandir 扫描代替两次 glob，目录项只 stat 一遍；
+    # scandir 的返回顺序由文件系统决定，显式排序保证批次确定性
+    html_files = sorted(
+        Path(entry.path)
+        for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.lower().endswith((".html", ".htm"))
+    )
 
     if not html_files:
         return []
 
-    results: list[RenderResult] = []
+    # 路径解析和输出路径推导只做一遍，不和渲染循环交错
+    jobs = [(f.resolve(), output_dir / f"{f.stem}.{fmt}") for f in html_files]
 
+    # 整个批次复用同一个浏览器实例，把启动开销摊薄到所有文件上；
+    # width/scale 在一次批量调用中不变，上下文也可以安全复用。
+    # 并发页面让等待（wait_ms）与导航、截图互相重叠；
+    # 大批次再按块分给多个 worker 进程，各自一个浏览器
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -214,24 +675,42 @@ def batch_render(
             f"[cyan]批量渲染 {len(html_files)} 个文件...", total=len(html_files)
         )
 
-        for html_file in html_files:
-            output_path = output_dir / f"{html_file.stem}.{fmt}"
-            try:
-                progress.update(task, description=f"[cyan]渲染 {html_file.name}...")
-                result = render_html_to_image(
-                    input_path=html_file,
-                    output_path=output_path,
+        if len(jobs) <= _MULTIPROCESS_THRESHOLD:
+
+            def on_done(
+                html_file: Path, _result: RenderResult | None, error: Exception | None
+            ) -> None:
+                if error is not None:
+                    if console:
+                        console.print(f"[red]✗[/] 处理失败: {html_file.name} - {error}")
+                else:
+                    progress.update(task, description=f"[cyan]渲染 {html_file.name}...")
+                progress.advance(task)
+
+            return asyncio.run(
+                _batch_render_async(
+                    jobs,
                     width=width,
                     scale=scale,
                     fmt=fmt,
                     quality=quality,
                     wait_ms=wait_ms,
+                    output_width=output_width,
+                    concurrency=max(concurrency, 1),
+                    on_done=on_done,
                 )
-                results.append(result)
-            except Exception as e:
-                if console:
-                    console.print(f"[red]✗[/] 处理失败: {html_file.name} - {e}")
-            finally:
-                progress.advance(task)
-
-    return results
+            )
+
+        return _batch_render_multiprocess(
+            jobs,
+            width=width,
+            scale=scale,
+            fmt=fmt,
+            quality=quality,
+            wait_ms=wait_ms,
+            output_width=output_width,
+            concurrency=max(concurrency, 1),
+            progress=progress,
+            task=task,
+            console=console,
+        )